@@ -14,10 +14,47 @@ To get cookies:
     4. Right-click a request → Copy as cURL
     5. Extract the cookie values
 """
-import requests
-import json
+import asyncio
+import functools
 import sys
-from datetime import datetime
+import time
+from collections import namedtuple
+from operator import attrgetter
+
+import httpx
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# A single extracted message; create_time is 0 when the API has none
+Msg = namedtuple("Msg", "id role content create_time parent")
+
+# Shared stand-in for missing nested dicts in the conversation mapping
+_EMPTY: dict = {}
+
+# Display labels for the known author roles
+_ROLE_DISPLAY = {
+    "user": "USER",
+    "assistant": "ASSISTANT",
+    "system": "SYSTEM",
+    "tool": "TOOL",
+    "unknown": "UNKNOWN",
+}
+
+# Message preview length in main()
+PREVIEW_CHARS = 500
+ELLIPSIS = "..."
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_hms(ts: int) -> str:
+    """Format a unix timestamp as local HH:MM:SS without building a datetime."""
+    # Offset is per timestamp: zones change it for DST and for other reasons (e.g. Moscow 2011/2014)
+    h, rem = divmod((ts + time.localtime(ts).tm_gmtoff) % 86400, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}"
 
 
 class ChatGPTClient:
@@ -32,84 +69,128 @@ class ChatGPTClient:
         }
         self.access_token = None
 
-    def get_access_token(self) -> str | None:
-        """Get access token from session endpoint."""
-        response = requests.get(
-            f"{self.BASE_URL}/api/auth/session",
-            cookies=self.cookies,
-            headers=self.headers
-        )
+        # One HTTP/2 connection, multiplexed across every request
+        self.client = httpx.Client(http2=True, cookies=cookies, headers=self.headers, timeout=30.0)
+
+    def close(self):
+        """Close the underlying HTTP client."""
+        self.client.close()
+
+    def _set_access_token(self, response: httpx.Response) -> str | None:
+        """Store the access token from a session endpoint response."""
         if response.status_code == 200:
-            data = response.json()
-            self.access_token = data.get("accessToken")
+            self.access_token = _loads(response.content).get("accessToken")
             if self.access_token:
                 self.headers["authorization"] = f"Bearer {self.access_token}"
+                self.client.headers["authorization"] = self.headers["authorization"]
             return self.access_token
         return None
 
+    def get_access_token(self) -> str | None:
+        """Get access token from session endpoint."""
+        return self._set_access_token(self.client.get(f"{self.BASE_URL}/api/auth/session"))
+
     def get_conversation(self, conversation_id: str) -> dict | None:
         """Fetch a conversation by ID."""
+        raw = self.get_conversation_bytes(conversation_id)
+        if raw:
+            return _loads(raw)
+        return None
+
+    def get_conversation_bytes(self, conversation_id: str) -> bytes | None:
+        """Fetch a conversation by ID as the raw JSON response body."""
         if not self.access_token:
             self.get_access_token()
 
-        response = requests.get(
-            f"{self.BASE_URL}/backend-api/conversation/{conversation_id}",
-            cookies=self.cookies,
-            headers=self.headers
+        response = self.client.get(
+            f"{self.BASE_URL}/backend-api/conversation/{conversation_id}"
         )
         if response.status_code == 200:
-            return response.json()
+            return response.content
         return None
 
+    def stream_conversation_to(self, conversation_id: str, path) -> bool:
+        """Stream a conversation's raw JSON straight to a file without parsing it."""
+        if not self.access_token:
+            self.get_access_token()
+
+        with self.client.stream(
+            "GET", f"{self.BASE_URL}/backend-api/conversation/{conversation_id}"
+        ) as response:
+            if response.status_code != 200:
+                return False
+            with open(path, "wb") as f:
+                for chunk in response.iter_bytes(65536):
+                    f.write(chunk)
+        return True
+
+    async def get_conversations_bulk(self, conversation_ids: list[str], concurrency: int = 16) -> list[dict | None]:
+        """Fetch several conversations concurrently over one multiplexed HTTP/2 connection."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Reuses the sync client's cookie jar and headers, so auth state stays in one place
+        async with httpx.AsyncClient(
+            http2=True, cookies=self.client.cookies, headers=self.client.headers, timeout=30.0
+        ) as client:
+            if not self.access_token:
+                self._set_access_token(await client.get(f"{self.BASE_URL}/api/auth/session"))
+                client.headers.update(self.client.headers)
+
+            async def fetch(conversation_id: str) -> dict | None:
+                async with semaphore:
+                    response = await client.get(
+                        f"{self.BASE_URL}/backend-api/conversation/{conversation_id}"
+                    )
+                if response.status_code == 200:
+                    return _loads(response.content)
+                return None
+
+            return await asyncio.gather(*(fetch(cid) for cid in conversation_ids))
+
     def list_conversations(self, limit: int = 20, offset: int = 0) -> dict | None:
         """List recent conversations."""
         if not self.access_token:
             self.get_access_token()
 
-        response = requests.get(
+        response = self.client.get(
             f"{self.BASE_URL}/backend-api/conversations",
             params={"limit": limit, "offset": offset},
-            cookies=self.cookies,
-            headers=self.headers
         )
         if response.status_code == 200:
-            return response.json()
+            return _loads(response.content)
         return None
 
     @staticmethod
-    def extract_messages(conversation_data: dict) -> list[dict]:
+    def extract_messages(conversation_data: dict) -> list[Msg]:
         """Extract readable messages from conversation data."""
         messages = []
+        append = messages.append
         mapping = conversation_data.get("mapping", {})
 
         for node_id, node in mapping.items():
-            msg = node.get("message")
-            if not msg:
+            msg = node.get("message") or _EMPTY
+            content = msg.get("content") or _EMPTY
+
+            # Skip empty nodes, hidden system messages and non-text content
+            if (
+                not msg
+                or (msg.get("metadata") or _EMPTY).get("is_visually_hidden_from_conversation")
+                or content.get("content_type") != "text"
+            ):
                 continue
 
-            author = msg.get("author", {}).get("role", "unknown")
-            content = msg.get("content", {})
-
-            # Skip system messages that are hidden
-            metadata = msg.get("metadata", {})
-            if metadata.get("is_visually_hidden_from_conversation"):
-                continue
-
-            # Extract text content
-            if content.get("content_type") == "text":
-                parts = content.get("parts", [])
-                text = "\n".join(str(p) for p in parts if p)
-                if text.strip():
-                    messages.append({
-                        "id": node_id,
-                        "role": author,
-                        "content": text,
-                        "create_time": msg.get("create_time"),
-                        "parent": node.get("parent"),
-                    })
+            text = "\n".join(map(str, filter(None, content.get("parts", []))))
+            if text.strip():
+                append(Msg(
+                    node_id,
+                    sys.intern((msg.get("author") or _EMPTY).get("role") or "unknown"),
+                    text,
+                    msg.get("create_time") or 0,
+                    node.get("parent"),
+                ))
 
         # Sort by create_time
-        messages.sort(key=lambda m: m.get("create_time") or 0)
+        messages.sort(key=attrgetter("create_time"))
         return messages
 
 
@@ -137,56 +218,65 @@ def main():
     print("=" * 50)
 
     client = ChatGPTClient(COOKIES)
-
-    # Get access token
-    print("Authenticating...")
-    token = client.get_access_token()
-    if not token:
-        print("ERROR: Failed to get access token. Cookies may be expired.")
-        print("Please update the COOKIES dict with fresh values from your browser.")
-        sys.exit(1)
-    print("Authenticated successfully!")
-    print()
-
-    # Fetch conversation
-    print(f"Fetching conversation: {conversation_id}")
-    data = client.get_conversation(conversation_id)
-
-    if not data:
-        print("ERROR: Failed to fetch conversation.")
-        sys.exit(1)
-
-    # Display conversation info
-    print(f"Title: {data.get('title', 'Untitled')}")
-    print()
-
-    # Extract and display messages
-    print("Messages:")
-    print("-" * 50)
-    messages = client.extract_messages(data)
-
-    for msg in messages:
-        role = msg["role"].upper()
-        content = msg["content"]
-
-        # Format timestamp
-        ts = msg.get("create_time")
-        time_str = ""
-        if ts:
-            time_str = f" [{datetime.fromtimestamp(ts).strftime('%H:%M:%S')}]"
-
-        print(f"\n[{role}]{time_str}")
-        print(content[:500] + ("..." if len(content) > 500 else ""))
-
-    print()
-    print("-" * 50)
-    print(f"Total messages: {len(messages)}")
-
-    # Save raw data to file
-    output_file = f"conversation_{conversation_id}.json"
-    with open(output_file, "w") as f:
-        json.dump(data, f, indent=2)
-    print(f"Raw data saved to: {output_file}")
+    try:
+        # Get access token
+        print("Authenticating...")
+        token = client.get_access_token()
+        if not token:
+            print("ERROR: Failed to get access token. Cookies may be expired.")
+            print("Please update the COOKIES dict with fresh values from your browser.")
+            sys.exit(1)
+        print("Authenticated successfully!")
+        print()
+
+        # Fetch conversation
+        print(f"Fetching conversation: {conversation_id}")
+        # Keep the raw body: it is parsed once for display and written to disk as-is
+        raw = client.get_conversation_bytes(conversation_id)
+
+        if not raw:
+            print("ERROR: Failed to fetch conversation.")
+            sys.exit(1)
+        data = _loads(raw)
+
+        # Display conversation info
+        print(f"Title: {data.get('title', 'Untitled')}")
+        print()
+
+        # Extract and display messages
+        print("Messages:")
+        print("-" * 50)
+        messages = client.extract_messages(data)
+
+        # Build the whole listing and write it in one call rather than two prints per message
+        out = []
+        for msg in messages:
+            role = _ROLE_DISPLAY.get(msg.role) or msg.role.upper()
+            content = msg.content
+
+            # Format timestamp
+            ts = msg.create_time
+            time_str = ""
+            if ts:
+                time_str = f" [{_fmt_hms(int(ts))}]"
+
+            preview = content[:PREVIEW_CHARS]
+            if len(preview) != len(content):
+                preview += ELLIPSIS
+            out.append(f"\n[{role}]{time_str}\n{preview}\n")
+        sys.stdout.write("".join(out))
+
+        print()
+        print("-" * 50)
+        print(f"Total messages: {len(messages)}")
+
+        # Save raw data to file
+        output_file = f"conversation_{conversation_id}.json"
+        with open(output_file, "wb") as f:
+            f.write(raw)
+        print(f"Raw data saved to: {output_file}")
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
@@ -3,9 +3,12 @@ ChatHub MCP Server
 
 An MCP server that allows ChatGPT users to save conversations to an archive.
 """
+import asyncio
+import gzip
 import json
+import logging
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +18,26 @@ from starlette.applications import Starlette
 from starlette.routing import Mount
 from mcp.server.fastmcp import FastMCP
 
+# Fast JSON codec for archive files and tool results, falling back to stdlib json.
+# Output is compact: archive files are gzipped and never read by hand.
+try:
+    import orjson
+
+    def _dumps(o) -> bytes:
+        return orjson.dumps(o, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS)
+except ImportError:
+    def _dumps(o) -> bytes:
+        return json.dumps(o, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+logger = logging.getLogger(__name__)
+
+
+def _write_gzip(path: Path, data: bytes) -> None:
+    """Write data gzip-compressed; level 1 keeps CPU cost close to a plain write."""
+    with gzip.open(path, "wb", compresslevel=1) as f:
+        f.write(data)
+
+
 # Archive directory (local S3 proxy)
 ARCHIVE_DIR = Path(__file__).parent / "archive"
 
@@ -61,7 +84,7 @@ mcp = FastMCP("ChatHub")
 
 
 @mcp.tool()
-def save_conversation(
+async def save_conversation(
     title: str,
     summary: str,
     messages: list[dict],
@@ -92,8 +115,8 @@ def save_conversation(
     """
     # Generate unique ID and timestamp
     conversation_id = str(uuid.uuid4())
-    saved_at = datetime.utcnow()
-    date_str = saved_at.strftime("%Y-%m-%d")
+    saved_at = datetime.now(timezone.utc).isoformat()
+    date_str = saved_at[:10]
 
     # Build the payload
     payload = {
@@ -103,38 +126,32 @@ def save_conversation(
         "messages": messages,
         "tags": tags or [],
         "key_points": key_points or [],
-        "saved_at": saved_at.isoformat(),
+        "saved_at": saved_at,
         "message_count": len(messages),
     }
 
     # Create directory structure: archive/{date}/
     save_dir = ARCHIVE_DIR / date_str
-    save_dir.mkdir(parents=True, exist_ok=True)
-
-    # Write JSON file
-    file_path = save_dir / f"{conversation_id}.json"
-    with open(file_path, "w") as f:
-        json.dump(payload, f, indent=2, default=str)
-
-    # Log to console
-    print("\n" + "=" * 60)
-    print("CONVERSATION SAVED")
-    print("=" * 60)
-    print(f"ID:       {conversation_id}")
-    print(f"Title:    {title}")
-    print(f"Messages: {len(messages)}")
-    print(f"Tags:     {tags or []}")
-    print(f"File:     {file_path}")
-    print("=" * 60 + "\n")
-
-    return json.dumps({
+    await asyncio.to_thread(save_dir.mkdir, parents=True, exist_ok=True)
+
+    # Write gzipped JSON off the event loop so other SSE clients keep being served
+    file_path = save_dir / f"{conversation_id}.json.gz"
+    data = _dumps(payload)
+    await asyncio.to_thread(_write_gzip, file_path, data)
+
+    logger.info(
+        "Conversation saved: id=%s title=%r messages=%d tags=%s file=%s",
+        conversation_id, title, len(messages), tags or [], file_path,
+    )
+
+    return _dumps({
         "status": "success",
         "id": conversation_id,
         "title": title,
         "message_count": len(messages),
-        "saved_at": saved_at.isoformat(),
+        "saved_at": saved_at,
         "file_path": str(file_path),
-    })
+    }).decode("utf-8")
 
 # Create Starlette app with SSE endpoint mounted
 app = Starlette(
@@ -144,7 +161,12 @@ app = Starlette(
 )
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     port = int(os.environ.get("PORT", 8000))
     print(f"Starting ChatHub MCP Server on port {port}...")
     print(f"SSE endpoint available at: http://localhost:{port}/sse")
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Single process: SSE sessions live in this process's memory, so no workers=
+    uvicorn.run(
+        app, host="0.0.0.0", port=port,
+        loop="uvloop", http="httptools", log_level="info", access_log=False,
+    )
@@ -4,15 +4,44 @@ Shared Consciousness Web UI
 A simple web interface to browse saved conversations.
 Run on port 8080 alongside the MCP server on 8000.
 """
+import gzip
+import hashlib
+import html
 import json
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import anyio
 import uvicorn
 from starlette.applications import Starlette
-from starlette.responses import HTMLResponse, JSONResponse
+from starlette.responses import HTMLResponse, Response, StreamingResponse
 from starlette.routing import Route
 
+# Fast JSON codec for archive files, falling back to stdlib json
+try:
+    import orjson
+
+    # orjson parses memoryviews, so large files can be parsed straight from an mmap
+    _LOADS_MMAP = True
+
+    def _loads(b):
+        return orjson.loads(b)
+
+    def _dumps(o) -> bytes:
+        return orjson.dumps(o, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _LOADS_MMAP = False
+
+    def _loads(b):
+        return json.loads(b)
+
+    def _dumps(o) -> bytes:
+        return json.dumps(o, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 ARCHIVE_DIR = Path(__file__).parent / "archive"
 
 # Dummy data for trending/roadmap features
@@ -34,103 +63,194 @@ ROADMAP_FEATURES = [
 ]
 
 
+# Parsed archive files keyed by path, with the mtime they were parsed at
+_CACHE: dict[str, tuple[float, dict]] = {}
+# Conversation ID (file name without extensions) -> archive file path
+_BY_ID: dict[str, str] = {}
+# Guards writes to _CACHE/_BY_ID; scans run concurrently on anyio worker threads
+_CACHE_LOCK = threading.Lock()
+
+
+# Cold loads above this many files are spread across a thread pool
+_PARALLEL_THRESHOLD = 32
+_MAX_WORKERS = 16
+
+
+# Plain .json files above this size are parsed from an mmap instead of a read() copy
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _parse_archive_file(path: str, size: int) -> dict:
+    """Parse an archive file, decompressing .json.gz and mmapping large .json files."""
+    if path.endswith(".gz"):
+        with gzip.open(path, "rb") as f:
+            return _loads(f.read())
+    with open(path, "rb") as f:
+        if _LOADS_MMAP and size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return _loads(view)
+        return _loads(f.read())
+
+
+def _conv_id(path: str) -> str:
+    """Conversation ID from an archive file name (strips .json / .json.gz)."""
+    return os.path.basename(path).split(".", 1)[0]
+
+
+def _load_one(item: tuple[os.DirEntry, os.stat_result]):
+    """Parse an uncached archive file and store it in the cache; None if unreadable."""
+    entry, st = item
+    key = entry.path
+    try:
+        conv = _parse_archive_file(key, st.st_size)
+    except Exception:
+        return None
+    conv["_file"] = key
+    with _CACHE_LOCK:
+        _CACHE[key] = (st.st_mtime, conv)
+    return conv
+
+
+def _scan_archive() -> list[os.DirEntry]:
+    """List archive .json/.json.gz files, newest date directory first."""
+    entries = []
+    if ARCHIVE_DIR.exists():
+        with os.scandir(ARCHIVE_DIR) as it:
+            date_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name, reverse=True)
+        for date_dir in date_dirs:
+            with os.scandir(date_dir.path) as it:
+                files = [e for e in it if e.name.endswith((".json", ".json.gz"))]
+            # Prefer the compressed copy when both exist; plain .json is read for older saves
+            names = {e.name for e in files}
+            files = [e for e in files if e.name + ".gz" not in names]
+            files.sort(key=lambda e: e.name, reverse=True)
+            entries.extend(files)
+    return entries
+
+
 def get_all_conversations():
     """Load all conversations from archive."""
+    entries = _scan_archive()
+
+    # Serve cache hits inline; only files that changed or are new need parsing
     conversations = []
-    if ARCHIVE_DIR.exists():
-        for date_dir in sorted(ARCHIVE_DIR.iterdir(), reverse=True):
-            if date_dir.is_dir():
-                for json_file in sorted(date_dir.glob("*.json"), reverse=True):
-                    try:
-                        with open(json_file) as f:
-                            conv = json.load(f)
-                            conv["_file"] = str(json_file)
-                            conversations.append(conv)
-                    except Exception:
-                        pass
+    misses = []
+    for entry in entries:
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        cached = _CACHE.get(entry.path)
+        if cached and cached[0] == st.st_mtime:
+            conversations.append(cached[1])
+        else:
+            misses.append((entry, st))
+
+    if len(misses) > _PARALLEL_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as ex:
+            loaded = list(ex.map(_load_one, misses))
+    else:
+        loaded = [_load_one(m) for m in misses]
+
+    conversations.extend(conv for conv in loaded if conv is not None)
+    conversations.sort(key=lambda c: c.get("saved_at", ""), reverse=True)
+    rebuild = bool(misses)
+
+    with _CACHE_LOCK:
+        # Drop entries for files that have been removed
+        for key in _CACHE.keys() - {e.path for e in entries}:
+            del _CACHE[key]
+            rebuild = True
+
+        if rebuild or len(_BY_ID) != len(_CACHE):
+            _BY_ID.clear()
+            _BY_ID.update((_conv_id(key), key) for key in _CACHE)
     return conversations
 
 
 def get_conversation(conv_id: str):
     """Load a specific conversation by ID."""
-    if ARCHIVE_DIR.exists():
-        for date_dir in ARCHIVE_DIR.iterdir():
-            if date_dir.is_dir():
-                for json_file in date_dir.glob("*.json"):
-                    if conv_id in json_file.name:
-                        with open(json_file) as f:
-                            return json.load(f)
-    return None
+    path = _BY_ID.get(conv_id)
+    if path is not None:
+        cached = _CACHE.get(path)
+        try:
+            if cached and cached[0] == os.stat(path).st_mtime:
+                return cached[1]
+        except OSError:
+            pass
+
+    # Unknown ID or stale entry: rescan the archive and retry
+    get_all_conversations()
+    path = _BY_ID.get(conv_id)
+    cached = _CACHE.get(path) if path else None
+    return cached[1] if cached else None
 
 
 # HTML Templates
-def base_html(title: str, content: str, active: str = "home") -> str:
-    nav_items = [
-        ("home", "/", "Archive"),
-        ("trending", "/trending", "Trending"),
-        ("roadmap", "/roadmap", "Roadmap"),
-    ]
-    nav_html = "".join([
-        f'<a href="{href}" class="nav-link {"active" if key == active else ""}">{label}</a>'
-        for key, href, label in nav_items
-    ])
+NAV_ITEMS = [
+    ("home", "/", "Archive"),
+    ("trending", "/trending", "Trending"),
+    ("roadmap", "/roadmap", "Roadmap"),
+]
 
-    return f"""<!DOCTYPE html>
+_DOC_START = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Shared Consciousness</title>
+    """
+
+_STYLE = """
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: #0a0a0a;
             color: #e5e5e5;
             min-height: 100vh;
-        }}
-        .container {{ max-width: 900px; margin: 0 auto; padding: 20px; }}
+        }
+        .container { max-width: 900px; margin: 0 auto; padding: 20px; }
 
         /* Header */
-        header {{
+        header {
             border-bottom: 1px solid #222;
             padding: 16px 0;
             margin-bottom: 32px;
-        }}
-        .header-inner {{
+        }
+        .header-inner {
             display: flex;
             justify-content: space-between;
             align-items: center;
             max-width: 900px;
             margin: 0 auto;
             padding: 0 20px;
-        }}
-        .logo {{
+        }
+        .logo {
             font-size: 20px;
             font-weight: 600;
             color: #fff;
             text-decoration: none;
-        }}
-        .logo span {{ color: #3b82f6; }}
-        nav {{ display: flex; gap: 8px; }}
-        .nav-link {{
+        }
+        .logo span { color: #3b82f6; }
+        nav { display: flex; gap: 8px; }
+        .nav-link {
             color: #888;
             text-decoration: none;
             padding: 8px 16px;
             border-radius: 6px;
             font-size: 14px;
             transition: all 0.2s;
-        }}
-        .nav-link:hover {{ color: #e5e5e5; background: #1a1a1a; }}
-        .nav-link.active {{ color: #fff; background: #1a1a1a; }}
+        }
+        .nav-link:hover { color: #e5e5e5; background: #1a1a1a; }
+        .nav-link.active { color: #fff; background: #1a1a1a; }
 
         /* Page titles */
-        h1 {{ font-size: 28px; font-weight: 600; margin-bottom: 8px; }}
-        .subtitle {{ color: #666; margin-bottom: 24px; }}
+        h1 { font-size: 28px; font-weight: 600; margin-bottom: 8px; }
+        .subtitle { color: #666; margin-bottom: 24px; }
 
         /* Conversation cards */
-        .conv-list {{ display: flex; flex-direction: column; gap: 12px; }}
-        .conv-card {{
+        .conv-list { display: flex; flex-direction: column; gap: 12px; }
+        .conv-card {
             background: #111;
             border: 1px solid #222;
             border-radius: 8px;
@@ -138,13 +258,13 @@ def base_html(title: str, content: str, active: str = "home") -> str:
             text-decoration: none;
             color: inherit;
             transition: all 0.2s;
-        }}
-        .conv-card:hover {{ border-color: #333; background: #151515; }}
-        .conv-title {{ font-size: 16px; font-weight: 500; margin-bottom: 6px; }}
-        .conv-summary {{ color: #888; font-size: 14px; line-height: 1.5; margin-bottom: 12px; }}
-        .conv-meta {{ display: flex; gap: 16px; font-size: 12px; color: #555; }}
-        .conv-meta span {{ display: flex; align-items: center; gap: 4px; }}
-        .tag {{
+        }
+        .conv-card:hover { border-color: #333; background: #151515; }
+        .conv-title { font-size: 16px; font-weight: 500; margin-bottom: 6px; }
+        .conv-summary { color: #888; font-size: 14px; line-height: 1.5; margin-bottom: 12px; }
+        .conv-meta { display: flex; gap: 16px; font-size: 12px; color: #555; }
+        .conv-meta span { display: flex; align-items: center; gap: 4px; }
+        .tag {
             display: inline-block;
             background: #1a1a2e;
             color: #6366f1;
@@ -152,28 +272,28 @@ def base_html(title: str, content: str, active: str = "home") -> str:
             border-radius: 4px;
             font-size: 11px;
             margin-right: 4px;
-        }}
+        }
 
         /* Detail view */
-        .back-link {{ color: #3b82f6; text-decoration: none; font-size: 14px; margin-bottom: 16px; display: inline-block; }}
-        .back-link:hover {{ text-decoration: underline; }}
-        .detail-header {{ margin-bottom: 24px; }}
-        .detail-tags {{ margin: 12px 0; }}
-        .key-points {{ background: #111; border-radius: 8px; padding: 16px; margin-bottom: 24px; }}
-        .key-points h3 {{ font-size: 14px; color: #888; margin-bottom: 12px; }}
-        .key-points ul {{ padding-left: 20px; }}
-        .key-points li {{ color: #ccc; margin-bottom: 6px; font-size: 14px; }}
+        .back-link { color: #3b82f6; text-decoration: none; font-size: 14px; margin-bottom: 16px; display: inline-block; }
+        .back-link:hover { text-decoration: underline; }
+        .detail-header { margin-bottom: 24px; }
+        .detail-tags { margin: 12px 0; }
+        .key-points { background: #111; border-radius: 8px; padding: 16px; margin-bottom: 24px; }
+        .key-points h3 { font-size: 14px; color: #888; margin-bottom: 12px; }
+        .key-points ul { padding-left: 20px; }
+        .key-points li { color: #ccc; margin-bottom: 6px; font-size: 14px; }
 
         /* Messages */
-        .messages {{ display: flex; flex-direction: column; gap: 16px; }}
-        .message {{ padding: 16px; border-radius: 8px; }}
-        .message.user {{ background: #1a1a2e; border-left: 3px solid #6366f1; }}
-        .message.assistant {{ background: #111; border-left: 3px solid #22c55e; }}
-        .message-role {{ font-size: 11px; text-transform: uppercase; color: #666; margin-bottom: 8px; font-weight: 600; }}
-        .message-content {{ font-size: 14px; line-height: 1.6; white-space: pre-wrap; }}
+        .messages { display: flex; flex-direction: column; gap: 16px; }
+        .message { padding: 16px; border-radius: 8px; }
+        .message.user { background: #1a1a2e; border-left: 3px solid #6366f1; }
+        .message.assistant { background: #111; border-left: 3px solid #22c55e; }
+        .message-role { font-size: 11px; text-transform: uppercase; color: #666; margin-bottom: 8px; font-weight: 600; }
+        .message-content { font-size: 14px; line-height: 1.6; white-space: pre-wrap; }
 
         /* Trending */
-        .trending-card {{
+        .trending-card {
             background: #111;
             border: 1px solid #222;
             border-radius: 8px;
@@ -181,13 +301,13 @@ def base_html(title: str, content: str, active: str = "home") -> str:
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
-        .trending-info h3 {{ font-size: 15px; margin-bottom: 4px; }}
-        .trending-team {{ font-size: 12px; color: #666; }}
-        .trending-stats {{ display: flex; gap: 16px; font-size: 13px; color: #888; }}
+        }
+        .trending-info h3 { font-size: 15px; margin-bottom: 4px; }
+        .trending-team { font-size: 12px; color: #666; }
+        .trending-stats { display: flex; gap: 16px; font-size: 13px; color: #888; }
 
         /* Roadmap */
-        .roadmap-item {{
+        .roadmap-item {
             background: #111;
             border: 1px solid #222;
             border-radius: 8px;
@@ -195,24 +315,38 @@ def base_html(title: str, content: str, active: str = "home") -> str:
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
-        .roadmap-info h3 {{ font-size: 15px; margin-bottom: 4px; }}
-        .roadmap-desc {{ font-size: 13px; color: #666; }}
-        .status-badge {{
+        }
+        .roadmap-info h3 { font-size: 15px; margin-bottom: 4px; }
+        .roadmap-desc { font-size: 13px; color: #666; }
+        .status-badge {
             font-size: 11px;
             padding: 4px 10px;
             border-radius: 12px;
             font-weight: 500;
-        }}
-        .status-badge.coming-soon {{ background: #1e3a2f; color: #22c55e; }}
-        .status-badge.planned {{ background: #1e293b; color: #3b82f6; }}
-        .status-badge.exploring {{ background: #2d2418; color: #f59e0b; }}
+        }
+        .status-badge.coming-soon { background: #1e3a2f; color: #22c55e; }
+        .status-badge.planned { background: #1e293b; color: #3b82f6; }
+        .status-badge.exploring { background: #2d2418; color: #f59e0b; }
 
         /* Empty state */
-        .empty {{ text-align: center; padding: 60px 20px; color: #555; }}
-        .empty h2 {{ color: #888; margin-bottom: 8px; }}
+        .empty { text-align: center; padding: 60px 20px; color: #555; }
+        .empty h2 { color: #888; margin-bottom: 8px; }
     </style>
-</head>
+"""
+
+_PAGE_END = """
+    </div>
+</body>
+</html>"""
+
+
+def _build_shell(active: str) -> tuple[str, str]:
+    """Build the (prefix, suffix) HTML around a page body for the given nav tab."""
+    nav_html = "".join([
+        f'<a href="{href}" class="nav-link {"active" if key == active else ""}">{label}</a>'
+        for key, href, label in NAV_ITEMS
+    ])
+    prefix = _STYLE + f"""</head>
 <body>
     <header>
         <div class="header-inner">
@@ -221,64 +355,95 @@ def base_html(title: str, content: str, active: str = "home") -> str:
         </div>
     </header>
     <div class="container">
-        {content}
-    </div>
-</body>
-</html>"""
+"""
+    return prefix, _PAGE_END
 
 
-async def home(request):
-    conversations = get_all_conversations()
+# Page shell per nav tab, built once at import time
+_HEAD_CACHE: dict[str, tuple[str, str]] = {key: _build_shell(key) for key, _, _ in NAV_ITEMS}
 
-    if not conversations:
-        content = """
+
+def _title_html(title: str) -> str:
+    return f"{_DOC_START}<title>{html.escape(str(title))} - Shared Consciousness</title>"
+
+
+# Body chunks joined per streamed write; StreamingResponse hops to a worker thread
+# for every item a sync iterator yields, so one item per message would be costly
+_STREAM_BATCH = 64
+
+
+def render(title: str, body_iter, active: str = "home"):
+    """Yield the page shell around the HTML chunks produced by body_iter, in batches."""
+    prefix, suffix = _HEAD_CACHE.get(active) or _build_shell(active)
+    batch = [_title_html(title), prefix]
+    for chunk in body_iter:
+        batch.append(chunk)
+        if len(batch) >= _STREAM_BATCH:
+            yield "".join(batch)
+            batch.clear()
+    batch.append(suffix)
+    yield "".join(batch)
+
+
+def base_html(title: str, content: str, active: str = "home") -> str:
+    prefix, suffix = _HEAD_CACHE.get(active) or _build_shell(active)
+    return _title_html(title) + prefix + content + suffix
+
+
+def _tags_html(tags) -> str:
+    return "".join([f'<span class="tag">{html.escape(str(t))}</span>' for t in tags])
+
+
+def _home_body(conversations):
+    yield """
         <h1>Conversation Archive</h1>
         <p class="subtitle">Your team's saved ChatGPT conversations</p>
-        <div class="empty">
-            <h2>No conversations yet</h2>
-            <p>Save a conversation from ChatGPT to see it here.</p>
-        </div>
+        <div class="conv-list">
         """
-    else:
-        cards = []
-        for conv in conversations:
-            tags_html = "".join([f'<span class="tag">{t}</span>' for t in conv.get("tags", [])[:3]])
-            saved = conv.get("saved_at", "")[:10]
-            cards.append(f"""
-            <a href="/conversation/{conv['id']}" class="conv-card">
-                <div class="conv-title">{conv.get('title', 'Untitled')}</div>
-                <div class="conv-summary">{conv.get('summary', '')[:200]}{'...' if len(conv.get('summary', '')) > 200 else ''}</div>
+    for conv in conversations:
+        tags_html = _tags_html(conv.get("tags", [])[:3])
+        saved = str(conv.get("saved_at", ""))[:10]
+        summary = str(conv.get("summary", ""))
+        yield f"""
+            <a href="/conversation/{html.escape(str(conv['id']))}" class="conv-card">
+                <div class="conv-title">{html.escape(str(conv.get('title', 'Untitled')))}</div>
+                <div class="conv-summary">{html.escape(summary[:200])}{'...' if len(summary) > 200 else ''}</div>
                 <div style="margin-bottom: 8px;">{tags_html}</div>
                 <div class="conv-meta">
                     <span>{conv.get('message_count', 0)} messages</span>
-                    <span>{saved}</span>
+                    <span>{html.escape(saved)}</span>
                 </div>
             </a>
-            """)
-
-        content = f"""
-        <h1>Conversation Archive</h1>
-        <p class="subtitle">Your team's saved ChatGPT conversations</p>
-        <div class="conv-list">
-            {"".join(cards)}
+            """
+    yield """
         </div>
         """
 
-    return HTMLResponse(base_html("Archive", content, "home"))
 
+async def home(request):
+    conversations = await anyio.to_thread.run_sync(get_all_conversations)
 
-async def conversation_detail(request):
-    conv_id = request.path_params["conv_id"]
-    conv = get_conversation(conv_id)
+    if not conversations:
+        body = ["""
+        <h1>Conversation Archive</h1>
+        <p class="subtitle">Your team's saved ChatGPT conversations</p>
+        <div class="empty">
+            <h2>No conversations yet</h2>
+            <p>Save a conversation from ChatGPT to see it here.</p>
+        </div>
+        """]
+    else:
+        body = _home_body(conversations)
+
+    return StreamingResponse(render("Archive", body, "home"), media_type="text/html")
 
-    if not conv:
-        return HTMLResponse(base_html("Not Found", "<h1>Conversation not found</h1>", "home"), status_code=404)
 
-    tags_html = "".join([f'<span class="tag">{t}</span>' for t in conv.get("tags", [])])
+def _conversation_body(conv):
+    tags_html = _tags_html(conv.get("tags", []))
 
     key_points_html = ""
     if conv.get("key_points"):
-        points = "".join([f"<li>{p}</li>" for p in conv["key_points"]])
+        points = "".join([f"<li>{html.escape(str(p))}</li>" for p in conv["key_points"]])
         key_points_html = f"""
         <div class="key-points">
             <h3>Key Points</h3>
@@ -286,94 +451,125 @@ async def conversation_detail(request):
         </div>
         """
 
-    messages_html = []
-    for msg in conv.get("messages", []):
-        role = msg.get("role", "user")
-        content = msg.get("content", "")
-        messages_html.append(f"""
-        <div class="message {role}">
-            <div class="message-role">{role}</div>
-            <div class="message-content">{content}</div>
-        </div>
-        """)
-
-    content = f"""
+    yield f"""
     <a href="/" class="back-link">&larr; Back to Archive</a>
     <div class="detail-header">
-        <h1>{conv.get('title', 'Untitled')}</h1>
-        <p class="subtitle">{conv.get('summary', '')}</p>
+        <h1>{html.escape(str(conv.get('title', 'Untitled')))}</h1>
+        <p class="subtitle">{html.escape(str(conv.get('summary', '')))}</p>
         <div class="detail-tags">{tags_html}</div>
         <div class="conv-meta">
             <span>{conv.get('message_count', 0)} messages</span>
-            <span>Saved {conv.get('saved_at', '')[:10]}</span>
+            <span>Saved {html.escape(str(conv.get('saved_at', ''))[:10])}</span>
         </div>
     </div>
     {key_points_html}
     <h2 style="font-size: 18px; margin-bottom: 16px;">Conversation</h2>
     <div class="messages">
-        {"".join(messages_html)}
+    """
+    for msg in conv.get("messages", []):
+        role = html.escape(str(msg.get("role", "user")))
+        content = html.escape(str(msg.get("content", "")))
+        yield f"""
+        <div class="message {role}">
+            <div class="message-role">{role}</div>
+            <div class="message-content">{content}</div>
+        </div>
+        """
+    yield """
     </div>
     """
 
-    return HTMLResponse(base_html(conv.get("title", "Conversation"), content, "home"))
 
+async def conversation_detail(request):
+    conv_id = request.path_params["conv_id"]
+    conv = await anyio.to_thread.run_sync(get_conversation, conv_id)
 
-async def trending(request):
-    cards = []
+    if not conv:
+        return HTMLResponse(base_html("Not Found", "<h1>Conversation not found</h1>", "home"), status_code=404)
+
+    return StreamingResponse(
+        render(conv.get("title", "Conversation"), _conversation_body(conv), "home"),
+        media_type="text/html",
+    )
+
+
+def _trending_body():
+    yield """
+    <h1>Trending Conversations</h1>
+    <p class="subtitle">Most viewed across your organization this week</p>
+    <div class="conv-list">
+    """
     for i, item in enumerate(DUMMY_TRENDING, 1):
-        cards.append(f"""
+        yield f"""
         <div class="trending-card">
             <div class="trending-info">
-                <h3>{i}. {item['title']}</h3>
-                <div class="trending-team">{item['team']}</div>
+                <h3>{i}. {html.escape(item['title'])}</h3>
+                <div class="trending-team">{html.escape(item['team'])}</div>
             </div>
             <div class="trending-stats">
                 <span>{item['views']} views</span>
                 <span>{item['saves']} saves</span>
             </div>
         </div>
-        """)
-
-    content = f"""
-    <h1>Trending Conversations</h1>
-    <p class="subtitle">Most viewed across your organization this week</p>
-    <div class="conv-list">
-        {"".join(cards)}
+        """
+    yield """
     </div>
     """
 
-    return HTMLResponse(base_html("Trending", content, "trending"))
 
+def _static_page(title: str, body_iter, active: str) -> tuple[bytes, str]:
+    """Render a page that never changes at runtime to bytes plus its ETag."""
+    body = base_html(title, "".join(body_iter), active).encode("utf-8")
+    return body, f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
 
-async def roadmap(request):
-    items = []
+
+def _static_response(request, body: bytes, etag: str):
+    if etag in (t.strip() for t in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="text/html", headers={"ETag": etag})
+
+
+_TRENDING_BYTES, _TRENDING_ETAG = _static_page("Trending", _trending_body(), "trending")
+
+
+async def trending(request):
+    return _static_response(request, _TRENDING_BYTES, _TRENDING_ETAG)
+
+
+def _roadmap_body():
+    yield """
+    <h1>Roadmap</h1>
+    <p class="subtitle">What we're building next</p>
+    <div class="conv-list">
+    """
     for feature in ROADMAP_FEATURES:
-        status_class = feature["status"]
-        status_label = feature["status"].replace("-", " ").title()
-        items.append(f"""
+        status_class = html.escape(feature["status"])
+        status_label = html.escape(feature["status"].replace("-", " ").title())
+        yield f"""
         <div class="roadmap-item">
             <div class="roadmap-info">
-                <h3>{feature['name']}</h3>
-                <div class="roadmap-desc">{feature['description']}</div>
+                <h3>{html.escape(feature['name'])}</h3>
+                <div class="roadmap-desc">{html.escape(feature['description'])}</div>
             </div>
             <span class="status-badge {status_class}">{status_label}</span>
         </div>
-        """)
-
-    content = f"""
-    <h1>Roadmap</h1>
-    <p class="subtitle">What we're building next</p>
-    <div class="conv-list">
-        {"".join(items)}
+        """
+    yield """
     </div>
     """
 
-    return HTMLResponse(base_html("Roadmap", content, "roadmap"))
+
+_ROADMAP_BYTES, _ROADMAP_ETAG = _static_page("Roadmap", _roadmap_body(), "roadmap")
+
+
+async def roadmap(request):
+    return _static_response(request, _ROADMAP_BYTES, _ROADMAP_ETAG)
 
 
 async def api_conversations(request):
     """JSON API endpoint for conversations."""
-    return JSONResponse(get_all_conversations())
+    conversations = await anyio.to_thread.run_sync(get_all_conversations)
+    return Response(_dumps(conversations), media_type="application/json")
 
 
 app = Starlette(
@@ -389,4 +585,7 @@ app = Starlette(
 if __name__ == "__main__":
     print("Starting Shared Consciousness Web UI...")
     print("UI available at: http://localhost:8080")
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(
+        app, host="0.0.0.0", port=8080,
+        loop="uvloop", http="httptools", log_level="info", access_log=False,
+    )